@@ -4,6 +4,7 @@ setup(
     name = "pyUbersolar",
     packages = ["ubersolar", "ubersolar.devices", "ubersolar.adv_parsers"],
     install_requires=["async_timeout>=4.0.1", "bleak>=0.17.0", "bleak-retry-connector>=2.9.0", "cryptography>=38.0.3"],
+    python_requires=">=3.10",
     version = "0.1.3",
     description = "A library to communicate with UberSolar devices",
     long_description= "API for accessing UberSolar UberSmart devices. Communication to/from the device via Bluetooth. Please view readme on github",
@@ -38,10 +38,16 @@ async def main(args: argparse.Namespace):
             await uber_smart.set_current_time()
 
     else:
-        for item in device:
-            uber_smart = UberSmart(device[item].device)
-            await uber_smart.get_info()
-            print(uber_smart.status_data)
+        # Poll devices concurrently; cap in-flight BLE connections.
+        semaphore = asyncio.Semaphore(4)
+
+        async def _get_one(item: str) -> None:
+            async with semaphore:
+                uber_smart = UberSmart(device[item].device)
+                await uber_smart.get_info()
+                print(uber_smart.status_data)
+
+        await asyncio.gather(*(_get_one(item) for item in device))
 
 
 if __name__ == "__main__":
@@ -5,52 +5,63 @@ import datetime
 import struct
 from typing import Any
 
+# Precompiled structs to avoid per-call format parsing and slice copies.
+_U_F = struct.Struct("<f").unpack_from
+_U_H = struct.Struct("<H").unpack_from
+_U_FFF = struct.Struct("<fff").unpack_from
+_U_HFFFF = struct.Struct("<hffff").unpack_from
+
 
 def process_ubersmart(data: bytearray) -> dict[str, Any]:
     """Process UberSmart data."""
 
-    if data[0] == 1:
-        return {
-            "fWaterTemperature": round(struct.unpack("<f", data[1:5])[0], 2),
-            "fManifoldTemperature": round(struct.unpack("<f", data[5:9])[0], 2),
-            "fStoredWater": round(struct.unpack("<f", data[9:13])[0], 2),
-        }
-
-    if data[0] == 2:
-        return {
-            "bElementOn": data[1],
-            "bPumpOn": data[2],
-            "bHolidayMode": data[3],
-            "eSolenoidMode": data[4],
-            "fSolenoidState": round(struct.unpack("<f", data[5:9])[0], 2),
-            "AllSwitches": data[:5],
-        }
-
-    if data[0] == 3:
-        _llu_time = struct.unpack("<Q", data[1:9])[0]
-        return {
-            "lluTime": datetime.datetime.fromtimestamp(_llu_time).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-            "fHours": round(struct.unpack("<f", data[9:13])[0], 2),  # Time on
-            "wLux": struct.unpack("<H", data[13:15])[0],
-        }
-
-    if data[0] == 4:
-        return {
-            "wRSSI": struct.unpack("<h", data[1:3])[0],
-            "fPanelVoltage": round(struct.unpack("<f", data[3:7])[0], 2),
-            "fChipTemp": round(struct.unpack("<f", data[7:11])[0], 2),
-            "fWaterLevel": round(struct.unpack("<f", data[11:15])[0], 2),
-            "fTankSize": round(struct.unpack("<f", data[15:19])[0], 2),
-        }
-
-    if data[0] == 5:
-        return {
-            "bPanelFaultCode": struct.unpack("<B", data[1:2])[0],
-            "bElementFaultCode": struct.unpack("<B", data[2:3])[0],
-            "bPumpFultCode": struct.unpack("<B", data[3:4])[0],
-            "bSolenoidFaultCode": struct.unpack("<B", data[4:5])[0],
-        }
-
-    return {}
+    # CPython compiles literal-constant match arms to a jump table.
+    match data[0]:
+        case 1:
+            water, manifold, stored = _U_FFF(data, 1)
+            return {
+                "fWaterTemperature": water,
+                "fManifoldTemperature": manifold,
+                "fStoredWater": stored,
+            }
+
+        case 2:
+            return {
+                "bElementOn": data[1],
+                "bPumpOn": data[2],
+                "bHolidayMode": data[3],
+                "eSolenoidMode": data[4],
+                "fSolenoidState": _U_F(data, 5)[0],
+                "AllSwitches": data[:5],
+            }
+
+        case 3:
+            _llu_time = int.from_bytes(data[1:9], "little")
+            return {
+                "lluTime": datetime.datetime.fromtimestamp(_llu_time).isoformat(
+                    sep=" ", timespec="seconds"
+                ),
+                "fHours": _U_F(data, 9)[0],  # Time on
+                "wLux": _U_H(data, 13)[0],
+            }
+
+        case 4:
+            rssi, panel_voltage, chip_temp, water_level, tank_size = _U_HFFFF(data, 1)
+            return {
+                "wRSSI": rssi,
+                "fPanelVoltage": panel_voltage,
+                "fChipTemp": chip_temp,
+                "fWaterLevel": water_level,
+                "fTankSize": tank_size,
+            }
+
+        case 5:
+            return {
+                "bPanelFaultCode": data[1],
+                "bElementFaultCode": data[2],
+                "bPumpFultCode": data[3],
+                "bSolenoidFaultCode": data[4],
+            }
+
+        case _:
+            return {}
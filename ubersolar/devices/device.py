@@ -32,6 +32,16 @@ DISCONNECT_DELAY = 8.5
 # We need to poll to get data
 POLL_INTERVAL = 60
 
+# Back off to at most this interval when the device stops answering
+MAX_POLL_INTERVAL = 15 * 60
+
+# How long to wait for a full status snapshot after subscribing
+FIRST_NOTIFY_TIMEOUT = 3.0
+
+# Status arrives as one notification per message tag; all of them
+# together make up a complete snapshot.
+_ALL_STATUS_TAGS = frozenset(range(1, 6))
+
 
 class CharacteristicMissingError(Exception):
     """Raised when a characteristic is missing."""
@@ -41,26 +51,10 @@ class UberSmartOperationError(Exception):
     """Raised when an operation fails."""
 
 
-def _uuid(comms_type: str = "service") -> UUID | str:
-    """Return UberSolar UUID."""
-
-    _uuid = {
-        "tx": "9af90c38",
-        "rx": "95b10712",
-        "service": "88665b98",
-        "FWVersion": "9af90c40",
-    }
-
-    if comms_type in _uuid:
-        return UUID(f"{_uuid[comms_type]}-0bfb-11ec-9a03-0242ac130003")
-
-    return "Incorrect type, choose between: tx, rx, FWVersion or service"
-
-
-READ_CHAR_UUID = _uuid(comms_type="tx")
-WRITE_CHAR_UUID = _uuid(comms_type="rx")
-SERVICE_CHAR_UUID = _uuid()
-FW_CHAR_UUID = _uuid(comms_type="FWVersion")
+READ_CHAR_UUID = UUID("9af90c38-0bfb-11ec-9a03-0242ac130003")  # tx
+WRITE_CHAR_UUID = UUID("95b10712-0bfb-11ec-9a03-0242ac130003")  # rx
+SERVICE_CHAR_UUID = UUID("88665b98-0bfb-11ec-9a03-0242ac130003")
+FW_CHAR_UUID = UUID("9af90c40-0bfb-11ec-9a03-0242ac130003")
 
 WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
 
@@ -90,30 +84,51 @@ class UberSolarBaseDevice:
         """Switchbot base class constructor."""
         self._interface = f"hci{interface}"
         self._device = device
+        self._address = device.address
+        self._name = f"{device.name} ({device.address})"
         self._retry_count: int = kwargs.pop("retry_count", DEFAULT_RETRY_COUNT)
+        self._keep_connected: bool = kwargs.pop("keep_connected", False)
         self._connect_lock = asyncio.Lock()
         self._operation_lock = asyncio.Lock()
         self._client: BleakClientWithServiceCache | None = None
+        self._cached_services: BleakGATTServiceCollection | None = None
         self._read_char: BleakGATTCharacteristic | None = None
         self._write_char: BleakGATTCharacteristic | None = None
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_deadline: float = 0.0
         self._expected_disconnect = False
-        self.loop = asyncio.get_event_loop()
-        self._callbacks: list[Callable[[], None]] = []
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._next_callback_token = 0
         self._notify_future: asyncio.Future[bytearray] | None = None
+        self._rx_queue: asyncio.Queue[bytearray] = asyncio.Queue()
+        self._rx_task: asyncio.Task[None] | None = None
+        self._full_status_future: asyncio.Future[None] | None = None
+        self._seen_tags: set[int] = set()
+        self._rx_frames = 0
         self.status_data: dict[str, Any] = {device.address: {}}
         self._last_full_update: float = -POLL_INTERVAL
+        self._consecutive_empty = 0
+        self._effective_poll_interval: float = POLL_INTERVAL
         self._timed_disconnect_task: asyncio.Task[None] | None = None
 
     async def _send_command(
-        self, key: str = "", retry: int | None = None
+        self, key: str | bytes = b"", retry: int | None = None
+    ) -> bytes | None:
+        """Send hex-encoded or raw bytes command to device and read response."""
+        if isinstance(key, (bytes, bytearray)):
+            return await self._send_command_bytes(bytes(key), retry)
+        return await self._send_command_bytes(bytes.fromhex(key), retry)
+
+    async def _send_command_bytes(
+        self, payload: bytes = b"", retry: int | None = None
     ) -> bytes | None:
         """Send command to device and read response."""
         if retry is None:
             retry = self._retry_count
 
-        command = bytearray.fromhex(key)
-        _LOGGER.debug("%s: Scheduling command %s", self.name, key)
+        command = payload
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
         max_attempts = retry + 1
         if self._operation_lock.locked():
             _LOGGER.debug(
@@ -165,7 +180,7 @@ class UberSolarBaseDevice:
     @property
     def name(self) -> str:
         """Return device name."""
-        return f"{self._device.name} ({self._device.address})"
+        return self._name
 
     async def _ensure_connected(self) -> None:
         """Ensure connection to device is established."""
@@ -188,6 +203,7 @@ class UberSolarBaseDevice:
                 self._device,
                 self.name,
                 self._disconnected,
+                cached_services=self._cached_services,
                 use_services_cache=True,
                 ble_device_callback=lambda: self._device,
             )
@@ -202,10 +218,13 @@ class UberSolarBaseDevice:
                     ex,
                     exc_info=True,
                 )
+                self._cached_services = None
                 await client.clear_cache()
                 await self._execute_forced_disconnect()
                 raise
 
+            self._cached_services = client.services
+
             self._client = client
             self._reset_disconnect_timer()
             await self._start_notify()
@@ -221,11 +240,17 @@ class UberSolarBaseDevice:
 
     def _reset_disconnect_timer(self) -> None:
         """Reset disconnect timer."""
-        self._cancel_disconnect_timer()
         self._expected_disconnect = False
-        self._disconnect_timer = self.loop.call_later(
-            DISCONNECT_DELAY, self._disconnect_from_timer
-        )
+        if self._keep_connected:
+            # Connection is held open until an explicit disconnect().
+            return
+        loop = asyncio.get_running_loop()
+        # Move the deadline; only arm a timer when none is pending.
+        self._disconnect_deadline = loop.time() + DISCONNECT_DELAY
+        if self._disconnect_timer is None:
+            self._disconnect_timer = loop.call_at(
+                self._disconnect_deadline, self._disconnect_from_timer
+            )
 
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
@@ -239,14 +264,22 @@ class UberSolarBaseDevice:
 
     def _disconnect_from_timer(self) -> None:
         """Disconnect from device."""
-        if self._operation_lock.locked() and self._client.is_connected:
+        self._disconnect_timer = None
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._disconnect_deadline:
+            # Deadline moved since the timer was armed; re-arm for the rest.
+            self._disconnect_timer = loop.call_at(
+                self._disconnect_deadline, self._disconnect_from_timer
+            )
+            return
+        client = self._client
+        if self._operation_lock.locked() and client is not None and client.is_connected:
             _LOGGER.debug(
                 "%s: Operation in progress, resetting disconnect timer",
                 self.name,
             )
             self._reset_disconnect_timer()
             return
-        self._cancel_disconnect_timer()
         self._timed_disconnect_task = asyncio.create_task(
             self._execute_timed_disconnect()
         )
@@ -257,6 +290,10 @@ class UberSolarBaseDevice:
             self._disconnect_timer.cancel()
             self._disconnect_timer = None
 
+    async def disconnect(self) -> None:
+        """Disconnect from device."""
+        await self._execute_forced_disconnect()
+
     async def _execute_forced_disconnect(self) -> None:
         """Execute forced disconnection."""
         self._cancel_disconnect_timer()
@@ -285,6 +322,9 @@ class UberSolarBaseDevice:
             self._client = None
             self._read_char = None
             self._write_char = None
+            if self._rx_task:
+                self._rx_task.cancel()
+                self._rx_task = None
             if client and client.is_connected:
                 _LOGGER.debug("%s: Disconnecting", self.name)
                 await client.disconnect()
@@ -319,15 +359,48 @@ class UberSolarBaseDevice:
 
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
-        _LOGGER.debug("%s: Received notification: %s", self.name, data)
-        self.status_data[self._device.address].update(process_ubersmart(data))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Received notification: %s", self.name, data)
+        # Keep bleak's delivery path O(1); parsing happens in _rx_loop.
+        self._rx_queue.put_nowait(data)
+
+    async def _rx_loop(self) -> None:
+        """Parse queued notifications off the BLE delivery path."""
+        status = self.status_data[self._address]
+        while True:
+            data = await self._rx_queue.get()
+            try:
+                status.update(process_ubersmart(data))
+            except Exception:  # pylint: disable=broad-except
+                # A bad frame must not kill the loop; wait for the next one.
+                _LOGGER.exception(
+                    "%s: Failed to parse notification: %s", self.name, data
+                )
+                continue
+            self._seen_tags.add(data[0])
+            self._rx_frames += 1
+            future = self._full_status_future
+            if future and not future.done() and self._seen_tags >= _ALL_STATUS_TAGS:
+                future.set_result(None)
 
     async def _start_notify(self) -> None:
         """Start notification."""
         _LOGGER.debug("%s: Subscribe to notifications", self.name)
 
+        if self._rx_task is None or self._rx_task.done():
+            self._rx_task = asyncio.create_task(self._rx_loop())
+        self._seen_tags.clear()
+        self._full_status_future = asyncio.get_running_loop().create_future()
         await self._client.start_notify(self._read_char, self._notification_handler)
-        await asyncio.sleep(3)
+        # Resume once a full status snapshot has arrived instead of a fixed sleep.
+        try:
+            await asyncio.wait_for(self._full_status_future, FIRST_NOTIFY_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.debug(
+                "%s: Incomplete status within %ss", self.name, FIRST_NOTIFY_TIMEOUT
+            )
+        finally:
+            self._full_status_future = None
 
     async def _execute_command_locked(self, command: bytes) -> None:
         """Execute command and read response."""
@@ -342,51 +415,71 @@ class UberSolarBaseDevice:
 
     def get_address(self) -> str:
         """Return address of device."""
-        return self._device.address
+        return self._address
 
     def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
         """Subscribe to device notifications."""
-        self._callbacks.append(callback)
+        token = self._next_callback_token
+        self._next_callback_token += 1
+        self._callbacks[token] = callback
 
         def _unsub() -> None:
             """Unsubscribe from device notifications."""
-            self._callbacks.remove(callback)
+            self._callbacks.pop(token, None)
 
         return _unsub
 
     async def update(self) -> bool:
         """Get device updates."""
+        frames_before = self._rx_frames
         await self.get_info()
         self._last_full_update = time.monotonic()
+        if self._rx_frames != frames_before:
+            self._consecutive_empty = 0
+            self._effective_poll_interval = POLL_INTERVAL
+        else:
+            # Device is dark; back the poll interval off exponentially.
+            self._consecutive_empty += 1
+            self._effective_poll_interval = min(
+                POLL_INTERVAL * 2**self._consecutive_empty, MAX_POLL_INTERVAL
+            )
         self._fire_callbacks()
         return True
 
+    def bump(self) -> None:
+        """Reset the poll interval, e.g. after user interaction."""
+        self._consecutive_empty = 0
+        self._effective_poll_interval = POLL_INTERVAL
+
     def poll_needed(self, seconds_since_last_poll: float | None) -> bool:
         """Return if device needs polling."""
         if (
             seconds_since_last_poll is not None
-            and seconds_since_last_poll < POLL_INTERVAL
+            and seconds_since_last_poll < self._effective_poll_interval
         ):
             return False
         time_since_last_full_update = time.monotonic() - self._last_full_update
-        if time_since_last_full_update < POLL_INTERVAL:
+        if time_since_last_full_update < self._effective_poll_interval:
             return False
         return True
 
     def _fire_callbacks(self) -> None:
         """Fire callbacks."""
         _LOGGER.debug("%s: Fire callbacks", self.name)
-        for callback in self._callbacks:
-            callback()
+        for callback in list(self._callbacks.values()):
+            try:
+                callback()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("%s: Error in subscriber callback", self.name)
 
     async def get_info(self) -> dict[str, Any] | None:
         """Get device statuses."""
 
         await self._send_command()
-        if not self.status_data[self._device.address]:
+        if not self.status_data[self._address]:
             _LOGGER.error("%s: Unsuccessful, no result from device", self.name)
 
-        return self.status_data[self._device.address]
+        return self.status_data[self._address] or None
 
     def _check_command_result(
         self, result: bytes | None, index: int, values: set[int]
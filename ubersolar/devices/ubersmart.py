@@ -1,6 +1,9 @@
 """Library to handle connection with UberSmart."""
 from __future__ import annotations
 
+import asyncio
+import datetime
+from functools import lru_cache, partialmethod
 import logging
 import struct
 import time
@@ -10,6 +13,40 @@ from .device import UberSolarBaseDevice, update_after_operation
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled struct for the 12-byte time payload (epoch, pad, utc offset, pad).
+_PACK_TIME = struct.Struct("<QxBxx").pack
+
+# How long a fetched switch state stays fresh enough to reuse.
+SWITCH_STATE_TTL = 2.0
+
+# Fixed command payloads and message ids.
+_CMD_ENABLE_WIFI_AP = b"\x14"
+_SWITCH_MSG_ID = 0x06
+_TIME_MSG_ID = 0x09
+
+# (index, value) writes into the 5-byte AllSwitches buffer per operation.
+# Indices: 1 element, 2 pump, 3 holiday, 4 solenoid (0 off, 1 on, 2 auto).
+# Element and pump can't be on at the same time.
+_SWITCH_OPS: dict[str, tuple[tuple[int, int], ...]] = {
+    "element_on": ((1, 1), (2, 0)),
+    "element_off": ((1, 0),),
+    "pump_on": ((1, 0), (2, 1)),
+    "pump_off": ((2, 0),),
+    "holiday_on": ((3, 1),),
+    "holiday_off": ((3, 0),),
+    "solinoid_off": ((4, 0),),
+    "solinoid_on": ((4, 1),),
+    "solinoid_auto": ((4, 2),),
+}
+
+
+@lru_cache(maxsize=8)
+def _offset_byte(offset: datetime.timedelta | None) -> int:
+    """Return the UTC offset payload byte for a timezone offset."""
+    if offset is None:
+        return 0
+    return int(offset.total_seconds() // 3600) & 0xFF
+
 
 class UberSmart(UberSolarBaseDevice):
     """Representation of a UberSmart Device."""
@@ -18,198 +55,155 @@ class UberSmart(UberSolarBaseDevice):
         """UberSolar UberSmart constructor."""
 
         super().__init__(*args, **kwargs)
+        self._switches_cache: bytearray | None = None
+        self._switches_fetched: float = -SWITCH_STATE_TTL
+        self._pending_switches: bytearray | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def _switches(self) -> bytearray:
+        """Return the cached AllSwitches buffer for this device."""
+        return self.status_data[self._address]["AllSwitches"]
+
+    async def _prepare_switches(self) -> bytearray:
+        """Return a fresh, validated AllSwitches buffer."""
+
+        now = time.monotonic()
+        if (
+            self._switches_cache is not None
+            and now - self._switches_fetched < SWITCH_STATE_TTL
+        ):
+            return self._switches_cache
+
+        if "AllSwitches" not in self.status_data[self._address]:
+            await self.update()
+
+        current_switches = self._switches()
+
+        if len(current_switches) != 5:
+            _LOGGER.error("Switch length has to be 5 bytes")
+
+        self._switches_cache = current_switches
+        self._switches_fetched = now
+        return current_switches
+
+    async def update(self) -> bool:
+        """Get device updates and drop the stale switch cache."""
+        self._switches_cache = None
+        return await super().update()
 
     @update_after_operation
-    async def toggle_switches_all(self, switches: str) -> None:
-        """Set all switches from hex string."""
+    async def toggle_switches_all(self, switches: str | bytes) -> None:
+        """Set all switches from hex string or 4 raw bytes."""
 
         # 1st byte is message id, use 06 to toggle switches.
         # need to send  all switches.
         # elementToggle, pumpToggle, holidayModeToggle, solenoidMode = 0 - off, 1 - on, 2 - auto
         # example 0600000002
-        if len(switches) != 8:
-            _LOGGER.error("Switch length has to be 8")
+        tail = bytes.fromhex(switches) if isinstance(switches, str) else bytes(switches)
+
+        if len(tail) != 4:
+            raise ValueError("Switches have to be 4 bytes (8 hex characters)")
 
-        await self._send_command(key=f"06{switches}")
+        await self._send_command_bytes(bytes((_SWITCH_MSG_ID,)) + tail)
         _LOGGER.info("%s: Toggle switches", self.name)
 
     async def enable_wifi_ap(self) -> None:
         """Enable Wifi ap mode on device."""
         # intended for firmware update but who knows.
-        await self._send_command(key="14")
+        await self._send_command_bytes(_CMD_ENABLE_WIFI_AP)
         _LOGGER.info("%s: Enable Wifi AP on device", self.name)
 
     @update_after_operation
     async def set_current_time(self) -> None:
         """Set current datetime on device."""
 
-        current_time = int(time.time())
-        ct_to_bytearray = bytearray(struct.pack("<Qxxxx", current_time))
-        ct_to_bytearray[9] = 2  # add utc offset on byte 9
+        payload = bytes((_TIME_MSG_ID,)) + _PACK_TIME(
+            int(time.time()),
+            _offset_byte(datetime.datetime.now().astimezone().utcoffset()),
+        )
 
-        await self._send_command(key=f"09{ct_to_bytearray.hex()}")
+        await self._send_command_bytes(payload)
         _LOGGER.info("%s: Send current time to device", self.name)
 
-    @update_after_operation
-    async def turn_on_element(self) -> None:
-        """Turn element switch on."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[1] = 1
-        current_switches[2] = 0  # Pump can't be on as well.
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Element On", self.name)
-
-    @update_after_operation
-    async def turn_off_element(self) -> None:
-        """Turn element switch off."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[1] = 0
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Element Off", self.name)
-
-    @update_after_operation
-    async def turn_on_pump(self) -> None:
-        """Turn pump switch on."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[1] = 0  # Pump and element can't be on at same time.
-        current_switches[2] = 1
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Pump On", self.name)
-
-    @update_after_operation
-    async def turn_off_pump(self) -> None:
-        """Turn pump switch off."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[2] = 0
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Pump Off", self.name)
-
-    @update_after_operation
-    async def turn_on_holiday(self) -> None:
-        """Turn holiday switch on."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[3] = 1
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Holiday On", self.name)
-
-    @update_after_operation
-    async def turn_off_holiday(self) -> None:
-        """Turn holiday switch off."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[3] = 0
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Holiday Off", self.name)
-
-    @update_after_operation
-    async def set_solinoid_off(self) -> None:
-        """Turn Solinoid off."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[4] = 0
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Solinoid Off", self.name)
-
-    @update_after_operation
-    async def set_solinoid_on(self) -> None:
-        """Turn Solinoid on."""
-
-        if not self.status_data:
-            await self.update()
-
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[4] = 1
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Solinoid On", self.name)
-
-    @update_after_operation
-    async def set_solinoid_auto(self) -> None:
-        """Set Solinoid to Auto."""
-
-        if not self.status_data:
+    async def _apply_switch_op(self, operation: str) -> None:
+        """Queue a named switch operation and wait for it to be written."""
+
+        current_switches = await self._prepare_switches()
+
+        if self._pending_switches is None:
+            self._pending_switches = bytearray(current_switches)
+            self._pending_switches[0] = _SWITCH_MSG_ID
+        for index, value in _SWITCH_OPS[operation]:
+            self._pending_switches[index] = value
+
+        # Operations queued in the same loop tick share one flush/write.
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_switches())
+        flush_task = self._flush_task
+
+        _LOGGER.info("%s: Queue switch operation %s", self.name, operation)
+        await flush_task
+
+    async def _flush_switches(self) -> None:
+        """Write the coalesced switch word to the device."""
+
+        # Yield once so back-to-back callers can merge their writes.
+        await asyncio.sleep(0)
+
+        wrote = False
+        try:
+            # Pending stays authoritative until its write lands, so an
+            # operation arriving mid-write merges into it instead of
+            # rebuilding from the stale pre-write buffer and reverting
+            # the in-flight change; loop to flush such merges.
+            while True:
+                pending = self._pending_switches
+                if pending is None:
+                    break
+
+                current_switches = self._switches()
+                if pending[1:] == current_switches[1:]:
+                    _LOGGER.info(
+                        "%s: Switch state unchanged, skipping write", self.name
+                    )
+                    self._pending_switches = None
+                    break
+
+                sent = bytes(pending)
+                try:
+                    await self._send_command_bytes(sent)
+                except Exception:
+                    # State on the device is unknown now; force a re-fetch
+                    # next time.
+                    self._switches_cache = None
+                    self._pending_switches = None
+                    raise
+
+                # Only mirror the applied state into the live buffer after the
+                # write succeeded, so a failed write can't fake an up-to-date
+                # state and short-circuit the retry as unchanged.
+                current_switches[:] = sent
+                self._switches_fetched = time.monotonic()
+                wrote = True
+                _LOGGER.info("%s: Wrote switch state %s", self.name, sent.hex())
+
+                if bytes(pending) == sent:
+                    # Nothing new merged while the write was in flight.
+                    self._pending_switches = None
+                    break
+        finally:
+            self._flush_task = None
+
+        if wrote:
+            self.bump()
             await self.update()
 
-        current_switches = self.status_data[self._device.address]["AllSwitches"]
-
-        if len(current_switches) != 5:
-            _LOGGER.error("Switch length has to be 5 bytes")
-
-        current_switches[0] = 6
-        current_switches[4] = 2
-
-        await self._send_command(key=current_switches.hex())
-        _LOGGER.info("%s: Turn Solinoid to Auto", self.name)
+    turn_on_element = partialmethod(_apply_switch_op, "element_on")
+    turn_off_element = partialmethod(_apply_switch_op, "element_off")
+    turn_on_pump = partialmethod(_apply_switch_op, "pump_on")
+    turn_off_pump = partialmethod(_apply_switch_op, "pump_off")
+    turn_on_holiday = partialmethod(_apply_switch_op, "holiday_on")
+    turn_off_holiday = partialmethod(_apply_switch_op, "holiday_off")
+    set_solinoid_off = partialmethod(_apply_switch_op, "solinoid_off")
+    set_solinoid_on = partialmethod(_apply_switch_op, "solinoid_on")
+    set_solinoid_auto = partialmethod(_apply_switch_op, "solinoid_auto")
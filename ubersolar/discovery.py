@@ -11,7 +11,9 @@ from .const import DEFAULT_RETRY_COUNT, DEFAULT_RETRY_TIMEOUT, DEFAULT_SCAN_TIME
 from .models import UberSolarAdvertisement
 
 _LOGGER = logging.getLogger(__name__)
-CONNECT_LOCK = asyncio.Lock()
+
+# Ignore re-advertisements unless RSSI moved at least this much (dBm).
+_RSSI_DELTA = 6
 
 
 class GetUberSolarDevices:
@@ -21,6 +23,7 @@ class GetUberSolarDevices:
         """Get UberSolar devices class constructor."""
         self._interface = f"hci{interface}"
         self._adv_data: dict[str, UberSolarAdvertisement] = {}
+        self._scan_lock = asyncio.Lock()
 
     def detection_callback(
         self,
@@ -29,45 +32,66 @@ class GetUberSolarDevices:
     ) -> None:
         """BTLE adv scan callback."""
 
-        if "UberSmart_" in device.name:
-            discovery = UberSolarAdvertisement(
-                device.address, device.name, device, advertisement_data.rssi, True
-            )
-            if discovery:
-                self._adv_data[discovery.address] = discovery
+        name = device.name or advertisement_data.local_name
+        if not name or not name.startswith("UberSmart_"):
+            return
+
+        previous = self._adv_data.get(device.address)
+        if previous and abs(previous.rssi - advertisement_data.rssi) < _RSSI_DELTA:
+            return
+
+        self._adv_data[device.address] = UberSolarAdvertisement(
+            device.address, name, device, advertisement_data.rssi, True
+        )
 
     async def discover(
         self, retry: int = DEFAULT_RETRY_COUNT, scan_timeout: int = DEFAULT_SCAN_TIMEOUT
     ) -> dict:
         """Find UberSolar devices."""
 
-        devices = None
-        devices = bleak.BleakScanner(
-            adapter=self._interface,
-            detection_callback=self.detection_callback,
-        )
+        for attempt in range(retry + 1):
+            devices = bleak.BleakScanner(
+                adapter=self._interface,
+                detection_callback=self.detection_callback,
+            )
 
-        async with CONNECT_LOCK:
-            await devices.start()
-            await asyncio.sleep(scan_timeout)
-            await devices.stop()
+            async with self._scan_lock:
+                await devices.start()
+                await asyncio.sleep(scan_timeout)
+                await devices.stop()
 
-        if devices is None:
-            if retry < 1:
-                _LOGGER.error(
-                    "Scanning for UberSolar devices failed. Stop trying", exc_info=True
-                )
+            if self._adv_data:
                 return self._adv_data
 
-            _LOGGER.warning(
-                "Error scanning for UberSolar devices. Retrying (remaining: %d)",
-                retry,
-            )
-            await asyncio.sleep(DEFAULT_RETRY_TIMEOUT)
-            return await self.discover(retry - 1, scan_timeout)
+            if attempt < retry:
+                _LOGGER.warning(
+                    "No UberSolar devices found. Retrying (remaining: %d)",
+                    retry - attempt,
+                )
+                await asyncio.sleep(DEFAULT_RETRY_TIMEOUT)
 
+        _LOGGER.error("Scanning for UberSolar devices failed. Stop trying")
         return self._adv_data
 
+    @classmethod
+    async def discover_multi(
+        cls,
+        interfaces: list[int],
+        retry: int = DEFAULT_RETRY_COUNT,
+        scan_timeout: int = DEFAULT_SCAN_TIMEOUT,
+    ) -> dict[str, UberSolarAdvertisement]:
+        """Scan several adapters in parallel and merge the results."""
+
+        scanners = [cls(interface) for interface in interfaces]
+        results = await asyncio.gather(
+            *(scanner.discover(retry, scan_timeout) for scanner in scanners)
+        )
+
+        merged: dict[str, UberSolarAdvertisement] = {}
+        for result in results:
+            merged.update(result)
+        return merged
+
     async def get_device_data(
         self, address: str
     ) -> dict[str, UberSolarAdvertisement] | None:
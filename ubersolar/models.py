@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from bleak.backends.device import BLEDevice
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UberSolarAdvertisement:
     """UberSolar advertisement."""
 